@@ -10,20 +10,31 @@ Port: 8002 (configurable via CREWAI_API_PORT env var)
 
 import os
 import sys
+import copy
 import json
 import traceback
+import atexit
+import logging
+import queue
+import hashlib
+import orjson
 import asyncio
 import time
+from functools import partial
 from concurrent.futures import ThreadPoolExecutor
-from typing import Dict, Any, Optional
-from datetime import datetime, timedelta
+from typing import Callable, Dict, Any, Optional
+from datetime import datetime, timezone
 from pathlib import Path
+from logging.handlers import QueueHandler, QueueListener
+from cachetools import TTLCache
 from dotenv import load_dotenv
 
 from fastapi import FastAPI, HTTPException
+from fastapi.encoders import jsonable_encoder
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-from pydantic import BaseModel, Field
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
+from pydantic import BaseModel, ConfigDict, Field
 from contextlib import asynccontextmanager
 
 # Add src to path to import umbrella_corp modules
@@ -35,6 +46,44 @@ from src.umbrella_corp.flows.googlesuite_flow import GoogleSuiteFlow
 
 load_dotenv()
 
+ENVIRONMENT = os.getenv("ENVIRONMENT", "development")
+# Tracebacks are only returned to clients in development
+IS_DEVELOPMENT = ENVIRONMENT == "development"
+
+# ============================================================================
+# Logging
+# ============================================================================
+
+# Handlers only enqueue records; a background QueueListener thread does the
+# actual stdout writes so request handlers never block on console I/O
+log = logging.getLogger("api")
+log.setLevel(logging.INFO)
+log.propagate = False
+
+
+
+class _DeferredQueueHandler(QueueHandler):
+    """QueueHandler that leaves traceback formatting to the listener thread"""
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # The stdlib prepare() runs the formatter here, on the logging thread,
+        # which renders exc_info into text; only merge msg/args (cheap and safe
+        # to hand across threads) and keep exc_info for the StreamHandler
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+_log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+log.addHandler(_DeferredQueueHandler(_log_queue))
+
+_log_stream_handler = logging.StreamHandler(sys.stdout)
+_log_stream_handler.setFormatter(logging.Formatter("%(asctime)s %(message)s"))
+_log_listener = QueueListener(_log_queue, _log_stream_handler)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
 # ============================================================================
 # Tool ID to Crew Name Mapping (needed for lifespan)
 # ============================================================================
@@ -78,6 +127,28 @@ TOOL_TO_CREW_MAPPING = {
     'google_docs_create': 'DOCS_MANAGEMENT_FLOW',
 }
 
+# Built once at import time; the mapping is static for the life of the process
+_TOOL_SET = frozenset(TOOL_TO_CREW_MAPPING)
+_TOOLS_LIST = tuple(TOOL_TO_CREW_MAPPING.keys())
+_LIST_RESPONSE_CACHED = {
+    "tools": list(_TOOLS_LIST),
+    "mappings": TOOL_TO_CREW_MAPPING,
+    "total": len(_TOOLS_LIST)
+}
+_LIST_RESPONSE_BODY = orjson.dumps(_LIST_RESPONSE_CACHED)
+
+# ============================================================================
+# Shared Executor for Blocking CrewAI Calls
+# ============================================================================
+
+# flow.kickoff() is synchronous; one pool is shared by all requests instead of
+# creating a new ThreadPoolExecutor per call
+CREWAI_MAX_WORKERS = int(os.getenv("CREWAI_MAX_WORKERS", "8"))
+EXECUTOR = ThreadPoolExecutor(
+    max_workers=CREWAI_MAX_WORKERS,
+    thread_name_prefix="crewai"
+)
+
 # ============================================================================
 # Lifespan Event Handler
 # ============================================================================
@@ -86,18 +157,34 @@ TOOL_TO_CREW_MAPPING = {
 async def lifespan(app: FastAPI):
     """Lifespan event handler for startup and shutdown"""
     # Startup
-    print("\n" + "="*60)
-    print("[START] CrewAI Tool Wrapper API Server")
-    print("="*60)
-    print(f"Environment: {os.getenv('ENVIRONMENT', 'development')}")
-    print(f"OpenAI API Key: {'[OK] Set' if os.getenv('OPENAI_API_KEY') else '[ERROR] Missing'}")
-    print(f"Gmail SMTP Email: {'[OK] Set' if os.getenv('GMAIL_SMTP_EMAIL') else '[ERROR] Missing'}")
-    print(f"Available Tools: {len(TOOL_TO_CREW_MAPPING)}")
-    print("[INFO] GoogleSuiteFlow will be initialized on first request (lazy loading)")
-    print("="*60 + "\n")
-    yield
-    # Shutdown (if needed)
-    pass
+    log.info("=" * 60)
+    log.info("[START] CrewAI Tool Wrapper API Server")
+    log.info("=" * 60)
+    log.info("Environment: %s", ENVIRONMENT)
+    log.info("OpenAI API Key: %s", '[OK] Set' if os.getenv('OPENAI_API_KEY') else '[ERROR] Missing')
+    log.info("Gmail SMTP Email: %s", '[OK] Set' if os.getenv('GMAIL_SMTP_EMAIL') else '[ERROR] Missing')
+    log.info("Available Tools: %d", len(TOOL_TO_CREW_MAPPING))
+    log.info("Executor Workers: %d", CREWAI_MAX_WORKERS)
+    if os.getenv("CREWAI_LAZY_INIT", "0") == "1":
+        log.info("[INFO] GoogleSuiteFlow will be initialized on first request (lazy loading)")
+    else:
+        # Warm the flow before serving so no request pays the 10-30s init cost
+        log.info("[INFO] Warming GoogleSuiteFlow before accepting requests...")
+        try:
+            await get_google_suite_flow()
+        except ValueError as e:
+            # Don't block startup; the first request retries and reports the error
+            log.error("[ERROR] GoogleSuiteFlow warm-up failed, falling back to lazy loading: %s", e)
+    KICKOFF_BATCHER.start()
+    if KICKOFF_BATCHER.enabled:
+        log.info("[INFO] Kickoff batching: up to %d requests per %dms window", CREWAI_BATCH_MAX, CREWAI_BATCH_WAIT_MS)
+    log.info("=" * 60)
+    try:
+        yield
+    finally:
+        # Shutdown: don't block on in-flight kickoffs, drop queued ones
+        await KICKOFF_BATCHER.stop()
+        EXECUTOR.shutdown(wait=False, cancel_futures=True)
 
 # ============================================================================
 # FastAPI App Setup
@@ -109,17 +196,57 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
 # CORS middleware for Sim/Flowise frontend
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],  # Configure appropriately for production
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+# ENABLE_CORS=0 skips it entirely (e.g. behind an ingress that handles CORS);
+# CORS_ORIGINS="https://a.example,https://b.example" uses Starlette's exact-match
+# path instead of the wildcard branch. Unset keeps allowing all origins.
+if os.getenv("ENABLE_CORS", "1") == "1":
+    CORS_ORIGINS = tuple(
+        origin.strip() for origin in os.getenv("CORS_ORIGINS", "").split(",") if origin.strip()
+    ) or ("*",)
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=CORS_ORIGINS,
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
+
+# SSE endpoint; its events must reach the client as soon as they are yielded
+STREAM_PATH = "/api/tools/google-suite/stream"
+
+
+class BypassCompressionForStreams:
+    """
+    Pure ASGI wrapper that routes STREAM_PATH around the compression middleware
+    
+    Compressors buffer small writes, which would hold back the stream's
+    start/heartbeat events; BrotliMiddleware has no content-type exclusion.
+    """
+    
+    def __init__(self, app, compressor, **options):
+        self.app = app
+        self.compressed_app = compressor(app, **options)
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope["path"] == STREAM_PATH:
+            await self.app(scope, receive, send)
+        else:
+            await self.compressed_app(scope, receive, send)
+
+
+# Compress large text responses (CrewAI output can be multi-KB email/calendar text).
+# Brotli when brotli-asgi is installed (it falls back to gzip for clients
+# without br support), otherwise Starlette's GZip middleware
+try:
+    from brotli_asgi import BrotliMiddleware
+    app.add_middleware(BypassCompressionForStreams, compressor=BrotliMiddleware, quality=4, minimum_size=1024)
+except ImportError:
+    app.add_middleware(BypassCompressionForStreams, compressor=GZipMiddleware, minimum_size=1024, compresslevel=5)
 
 # ============================================================================
 # Request/Response Models
@@ -127,8 +254,10 @@ app.add_middleware(
 
 class ToolExecuteRequest(BaseModel):
     """Request model for tool execution"""
+    model_config = ConfigDict(extra='ignore', frozen=False)
+    
     toolId: str = Field(..., description="Tool identifier (e.g., 'google_calendar_create')")
-    params: Dict[str, Any] = Field(default_factory=dict, description="Tool parameters")
+    params: dict[str, Any] = Field(default_factory=dict, description="Tool parameters")
     userQuery: Optional[str] = Field(None, description="Optional natural language query (auto-generated if not provided)")
 
 
@@ -156,185 +285,418 @@ class ToolListResponse(BaseModel):
 
 # TOOL_TO_CREW_MAPPING moved above (before lifespan definition)
 
+# Static part of the health response; only the timestamp changes per call
+_HEALTH_RESPONSE_BASE = {
+    "status": "healthy",
+    "service": "CrewAI Tool Wrapper API",
+    "version": "1.0.0"
+}
+
+
+def tool_execute_response(
+    success: bool,
+    output: Any = None,
+    error: Optional[str] = None,
+    metadata: Optional[Dict[str, Any]] = None
+) -> Response:
+    """
+    Build a ToolExecuteResponse-shaped body and serialize it directly
+    
+    Returning a Response skips FastAPI's response_model validation pass;
+    ToolExecuteResponse is kept for the OpenAPI schema only.
+    """
+    content = {
+        "success": success,
+        "output": output,
+        "error": error,
+        "metadata": metadata
+    }
+    try:
+        return ORJSONResponse(content=content)
+    except TypeError:
+        # orjson rejects integers beyond 64 bits and lone surrogates, which the
+        # stdlib encoder handles (ASCII-escaped)
+        return Response(content=json.dumps(content, default=str), media_type="application/json")
+
 # ============================================================================
 # Flow Cache (Singleton Pattern)
 # ============================================================================
 
-_flow_cache: Dict[str, GoogleSuiteFlow] = {}
+_flow: Optional[GoogleSuiteFlow] = None
+# In-flight build shared by every caller that arrives before it finishes
+_flow_build: Optional[asyncio.Future] = None
 
-def get_google_suite_flow() -> GoogleSuiteFlow:
+def _build_google_suite_flow() -> GoogleSuiteFlow:
     """
-    Get or create GoogleSuiteFlow instance (singleton)
+    Create the GoogleSuiteFlow instance (blocking; run on EXECUTOR)
     
     Follows the same pattern as router_flow.py:
     - Initializes with: GoogleSuiteFlow(name, api_key)
     - Matches the OFFICE_FLOWS pattern in router_flow.py
     """
-    cache_key = 'google_suite'
+    api_key = os.getenv("OPENAI_API_KEY")
+    if not api_key:
+        raise ValueError("OPENAI_API_KEY not set in environment variables")
     
-    if cache_key not in _flow_cache:
-        api_key = os.getenv("OPENAI_API_KEY")
-        if not api_key:
-            raise ValueError("OPENAI_API_KEY not set in environment variables")
-        
-        # Follow umbrella_corp pattern: GoogleSuiteFlow("Google Suite Flow", OPENAI_API_KEY)
-        # As seen in router_flow.py lines 189-191
-        # NOTE: This initialization is slow because it:
-        # 1. Initializes GoogleSuiteCrew (loads agents/tools)
-        # 2. Initializes semantic routers (reads JSON files, creates OpenAI routers)
-        # This is why we do lazy initialization - only create flow on first request
-        print(f"[START] Initializing GoogleSuiteFlow (this may take 10-30 seconds)...")
-        print(f"[INFO] Loading semantic routers and Google Suite Crew...")
-        start_init_time = time.time()
+    # Follow umbrella_corp pattern: GoogleSuiteFlow("Google Suite Flow", OPENAI_API_KEY)
+    # As seen in router_flow.py lines 189-191
+    # NOTE: This initialization is slow because it:
+    # 1. Initializes GoogleSuiteCrew (loads agents/tools)
+    # 2. Initializes semantic routers (reads JSON files, creates OpenAI routers)
+    # This is why it runs once in lifespan startup (or on first request with CREWAI_LAZY_INIT=1)
+    log.info("[START] Initializing GoogleSuiteFlow (this may take 10-30 seconds)...")
+    log.info("[INFO] Loading semantic routers and Google Suite Crew...")
+    start_init_time = time.perf_counter()
+    try:
+        flow = GoogleSuiteFlow(
+            name="Google Suite Flow",  # Matches router_flow.py pattern
+            api_key=api_key
+        )
+        elapsed = time.perf_counter() - start_init_time
+        log.info("[OK] GoogleSuiteFlow initialized successfully in %.2fs", elapsed)
+        return flow
+    except Exception as e:
+        log.exception("[ERROR] Failed to initialize GoogleSuiteFlow: %s", e)
+        raise ValueError(f"Flow initialization failed: {str(e)}")
+
+
+async def get_google_suite_flow() -> GoogleSuiteFlow:
+    """
+    Get or create GoogleSuiteFlow instance (singleton)
+    
+    The fast path is a single global read. Otherwise the first caller
+    starts one build on EXECUTOR (so the event loop keeps serving) and every
+    caller awaits that same future through asyncio.shield: a caller being
+    cancelled (e.g. a /stream client disconnecting) doesn't cancel the
+    build, and a finished build is always stored in _flow.
+    """
+    global _flow_build
+    if _flow is not None:
+        return _flow
+    # No await between the check and the assignment, so only one build starts
+    if _flow_build is None:
+        loop = asyncio.get_running_loop()
+        _flow_build = loop.run_in_executor(EXECUTOR, _build_google_suite_flow)
+        _flow_build.add_done_callback(_store_built_flow)
+    return await asyncio.shield(_flow_build)
+
+
+def _store_built_flow(build: asyncio.Future) -> None:
+    """Keep a successful build; after a failure the next caller retries"""
+    global _flow, _flow_build
+    _flow_build = None
+    if not build.cancelled() and build.exception() is None:
+        _flow = build.result()
+
+# ============================================================================
+# Kickoff Batching
+# ============================================================================
+
+# Off by default: GoogleSuiteFlow has no batch API, so batching only adds
+# queueing latency until one exists
+CREWAI_BATCH_MAX = int(os.getenv("CREWAI_BATCH_MAX", "1"))
+CREWAI_BATCH_WAIT_MS = int(os.getenv("CREWAI_BATCH_WAIT_MS", "20"))
+
+
+class KickoffBatcher:
+    """
+    Coalesce concurrent flow.kickoff() calls into batches
+    
+    Requests arriving within wait_ms of each other (up to max_size) are
+    dispatched to EXECUTOR together and results are fanned back to each
+    caller through its own Future. GoogleSuiteFlow has no kickoff_for_each,
+    so a batch runs as parallel kickoffs, bounded by the executor size.
+    Batching is disabled when max_size <= 1.
+    """
+    
+    def __init__(self, max_size: int, wait_ms: int):
+        self.max_size = max_size
+        self.wait_seconds = wait_ms / 1000
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        # Captured once in start(); the batcher only ever runs on that loop
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+    
+    @property
+    def enabled(self) -> bool:
+        return self.max_size > 1
+    
+    def start(self) -> None:
+        """Start the collector task (call from the running event loop)"""
+        if self.enabled and self._worker is None:
+            self._loop = asyncio.get_running_loop()
+            self._queue = asyncio.Queue()
+            self._worker = asyncio.create_task(self._collect(), name="crewai-batcher")
+    
+    async def stop(self) -> None:
+        """Stop the collector task and cancel callers still waiting in the queue"""
+        if self._worker is None:
+            return
+        self._worker.cancel()
         try:
-            _flow_cache[cache_key] = GoogleSuiteFlow(
-                name="Google Suite Flow",  # Matches router_flow.py pattern
-                api_key=api_key
-            )
-            elapsed = time.time() - start_init_time
-            print(f"[OK] GoogleSuiteFlow initialized successfully in {elapsed:.2f}s")
-        except Exception as e:
-            print(f"[ERROR] Failed to initialize GoogleSuiteFlow: {str(e)}")
-            traceback.print_exc()
-            raise ValueError(f"Flow initialization failed: {str(e)}")
+            await self._worker
+        except asyncio.CancelledError:
+            pass
+        while not self._queue.empty():
+            _, _, future = self._queue.get_nowait()
+            future.cancel()
+        self._worker = None
+        self._queue = None
+        self._loop = None
+    
+    async def submit(self, flow: GoogleSuiteFlow, inputs: Dict[str, Any]) -> Any:
+        """Run flow.kickoff(inputs=inputs) as part of the next batch"""
+        if self._worker is None:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(EXECUTOR, partial(flow.kickoff, inputs=inputs))
+        
+        future = self._loop.create_future()
+        await self._queue.put((flow, inputs, future))
+        return await future
     
-    return _flow_cache[cache_key]
+    async def _collect(self) -> None:
+        loop = self._loop
+        while True:
+            batch = []
+            try:
+                batch.append(await self._queue.get())
+                deadline = loop.time() + self.wait_seconds
+                while len(batch) < self.max_size:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                    except asyncio.TimeoutError:
+                        break
+                # Dispatch without waiting so the next batch can start collecting
+                self._dispatch(batch)
+                batch = []
+            finally:
+                # Cancelled mid-collection (stop()): items already taken off the
+                # queue would otherwise leave their callers waiting forever
+                for _, _, future in batch:
+                    if not future.done():
+                        future.cancel()
+    
+    def _dispatch(self, batch: list) -> None:
+        # One executor future per item: each caller resumes as soon as its own
+        # kickoff finishes instead of waiting for the slowest one in the batch
+        for flow, inputs, future in batch:
+            pending = self._loop.run_in_executor(EXECUTOR, partial(flow.kickoff, inputs=inputs))
+            pending.add_done_callback(partial(self._resolve, future))
+    
+    @staticmethod
+    def _resolve(future: asyncio.Future, pending: asyncio.Future) -> None:
+        if future.done():
+            # Caller went away (client disconnected / request cancelled)
+            return
+        if pending.cancelled():
+            future.cancel()
+        elif pending.exception() is not None:
+            future.set_exception(pending.exception())
+        else:
+            future.set_result(pending.result())
+
+KICKOFF_BATCHER = KickoffBatcher(CREWAI_BATCH_MAX, CREWAI_BATCH_WAIT_MS)
 
 # ============================================================================
 # Parameter to Query Conversion
 # ============================================================================
 
+# Google Calendar
+
+def _q_calendar_create(params: Dict[str, Any]) -> str:
+    get = params.get
+    summary = get('summary', 'event')
+    start = get('start', {})
+    end = get('end', {})
+    start_time = start.get('dateTime', '') if isinstance(start, dict) else str(start)
+    end_time = end.get('dateTime', '') if isinstance(end, dict) else str(end)
+    description = get('description', '')
+    attendees = get('attendees', [])
+    
+    parts = [f"Create calendar event: {summary}"]
+    if start_time:
+        parts.append(f"from {start_time}")
+    if end_time:
+        parts.append(f"to {end_time}")
+    if description:
+        parts.append(f"with description: {description}")
+    if attendees:
+        parts.append(f"with attendees: {', '.join(attendees) if isinstance(attendees, list) else attendees}")
+    return " ".join(parts)
+
+
+def _q_calendar_list(params: Dict[str, Any]) -> str:
+    get = params.get
+    time_min = get('timeMin', 'now')
+    time_max = get('timeMax', 'future')
+    max_results = get('maxResults', 10)
+    return f"List calendar events from {time_min} to {time_max}, maximum {max_results} results"
+
+
+def _q_calendar_get(params: Dict[str, Any]) -> str:
+    event_id = params.get('eventId', '')
+    return f"Get calendar event with ID: {event_id}"
+
+
+def _q_calendar_update(params: Dict[str, Any]) -> str:
+    get = params.get
+    event_id = get('eventId', '')
+    summary = get('summary', '')
+    return f"Update calendar event {event_id} with title: {summary}"
+
+
+def _q_calendar_delete(params: Dict[str, Any]) -> str:
+    event_id = params.get('eventId', '')
+    return f"Delete calendar event with ID: {event_id}"
+
+
+# Gmail
+
+def _q_gmail_send(params: Dict[str, Any]) -> str:
+    get = params.get
+    to = get('to', '')
+    subject = get('subject', '')
+    body = get('body', '')
+    cc = get('cc')
+    bcc = get('bcc')
+    
+    parts = [f"Send email to {to} with subject '{subject}'"]
+    if body:
+        preview = f"{body[:100]}..." if len(body) > 100 else body
+        parts.append(f" and body: {preview}")
+    if cc:
+        parts.append(f", CC: {cc}")
+    if bcc:
+        parts.append(f", BCC: {bcc}")
+    return "".join(parts)
+
+
+def _q_gmail_read(params: Dict[str, Any]) -> str:
+    get = params.get
+    hours = get('hours', 24)
+    unread_only = get('unread_only', True)
+    max_results = get('maxResults', 10)
+    return f"Read {'unread' if unread_only else 'recent'} emails from the last {hours} hours, maximum {max_results} results"
+
+
+def _q_gmail_search(params: Dict[str, Any]) -> str:
+    query_param = params.get('query', '')
+    return f"Search emails with query: {query_param}"
+
+
+def _q_gmail_reply(params: Dict[str, Any]) -> str:
+    get = params.get
+    original_from = get('original_from_email', '')
+    original_subject = get('original_subject', '')
+    reply_body = get('reply_body', '')
+    return f"Reply to email from {original_from} with subject '{original_subject}' and reply: {reply_body[:100]}..."
+
+
+# Google Drive
+
+def _q_drive_upload(params: Dict[str, Any]) -> str:
+    get = params.get
+    file_name = get('fileName') or get('name', 'file')
+    folder_id = get('folderId', '')
+    if folder_id:
+        return f"Upload file {file_name} to Google Drive folder {folder_id}"
+    return f"Upload file {file_name} to Google Drive"
+
+
+def _q_drive_list(params: Dict[str, Any]) -> str:
+    get = params.get
+    folder_id = get('folderId', '')
+    query = get('query', '')
+    if query:
+        return f"List files in Google Drive matching: {query}"
+    if folder_id:
+        return f"List files in Google Drive folder {folder_id}"
+    return "List files in Google Drive"
+
+
+def _q_drive_download(params: Dict[str, Any]) -> str:
+    file_id = params.get('fileId', '')
+    return f"Download file from Google Drive with ID: {file_id}"
+
+
+def _q_drive_share(params: Dict[str, Any]) -> str:
+    get = params.get
+    file_id = get('fileId', '')
+    email = get('email', '')
+    return f"Share Google Drive file {file_id} with {email}"
+
+
+def _q_drive_create_folder(params: Dict[str, Any]) -> str:
+    get = params.get
+    folder_name = get('name', 'New Folder')
+    parent_id = get('parentId', '')
+    if parent_id:
+        return f"Create folder '{folder_name}' in Google Drive folder {parent_id}"
+    return f"Create folder '{folder_name}' in Google Drive"
+
+
+# Google Sheets
+
+def _q_sheets_read(params: Dict[str, Any]) -> str:
+    get = params.get
+    spreadsheet_id = get('spreadsheetId', '')
+    range_name = get('range', '')
+    return f"Read data from Google Sheets {spreadsheet_id} range {range_name}"
+
+
+def _q_sheets_write(params: Dict[str, Any]) -> str:
+    get = params.get
+    spreadsheet_id = get('spreadsheetId', '')
+    range_name = get('range', '')
+    return f"Write data to Google Sheets {spreadsheet_id} range {range_name}"
+
+
+# Google Docs
+
+def _q_docs_read(params: Dict[str, Any]) -> str:
+    document_id = params.get('documentId', '')
+    return f"Read Google Docs document {document_id}"
+
+
+def _q_docs_create(params: Dict[str, Any]) -> str:
+    title = params.get('title', 'New Document')
+    return f"Create Google Docs document with title: {title}"
+
+
+# Tool ID -> query builder; tools without an entry fall back to a JSON dump of params
+_QUERY_BUILDERS: Dict[str, Callable[[Dict[str, Any]], str]] = {
+    'google_calendar_create': _q_calendar_create,
+    'google_calendar_list': _q_calendar_list,
+    'google_calendar_get': _q_calendar_get,
+    'google_calendar_update': _q_calendar_update,
+    'google_calendar_delete': _q_calendar_delete,
+    'gmail_send': _q_gmail_send,
+    'gmail_read': _q_gmail_read,
+    'gmail_search': _q_gmail_search,
+    'gmail_reply': _q_gmail_reply,
+    'google_drive_upload': _q_drive_upload,
+    'google_drive_list': _q_drive_list,
+    'google_drive_download': _q_drive_download,
+    'google_drive_share': _q_drive_share,
+    'google_drive_create_folder': _q_drive_create_folder,
+    'google_sheets_read': _q_sheets_read,
+    'google_sheets_write': _q_sheets_write,
+    'google_docs_read': _q_docs_read,
+    'google_docs_create': _q_docs_create,
+}
+
+
 def convert_params_to_user_query(tool_id: str, params: Dict[str, Any]) -> str:
     """Convert structured parameters to natural language query for CrewAI"""
-    
-    # Google Calendar
-    if tool_id == 'google_calendar_create':
-        summary = params.get('summary', 'event')
-        start = params.get('start', {})
-        end = params.get('end', {})
-        start_time = start.get('dateTime', '') if isinstance(start, dict) else str(start)
-        end_time = end.get('dateTime', '') if isinstance(end, dict) else str(end)
-        description = params.get('description', '')
-        attendees = params.get('attendees', [])
-        
-        query = f"Create calendar event: {summary}"
-        if start_time:
-            query += f" from {start_time}"
-        if end_time:
-            query += f" to {end_time}"
-        if description:
-            query += f" with description: {description}"
-        if attendees:
-            query += f" with attendees: {', '.join(attendees) if isinstance(attendees, list) else attendees}"
-        return query
-    
-    elif tool_id == 'google_calendar_list':
-        time_min = params.get('timeMin', 'now')
-        time_max = params.get('timeMax', 'future')
-        max_results = params.get('maxResults', 10)
-        return f"List calendar events from {time_min} to {time_max}, maximum {max_results} results"
-    
-    elif tool_id == 'google_calendar_get':
-        event_id = params.get('eventId', '')
-        return f"Get calendar event with ID: {event_id}"
-    
-    elif tool_id == 'google_calendar_update':
-        event_id = params.get('eventId', '')
-        summary = params.get('summary', '')
-        return f"Update calendar event {event_id} with title: {summary}"
-    
-    elif tool_id == 'google_calendar_delete':
-        event_id = params.get('eventId', '')
-        return f"Delete calendar event with ID: {event_id}"
-    
-    # Gmail
-    elif tool_id == 'gmail_send':
-        to = params.get('to', '')
-        subject = params.get('subject', '')
-        body = params.get('body', '')
-        cc = params.get('cc')
-        bcc = params.get('bcc')
-        
-        query = f"Send email to {to} with subject '{subject}'"
-        if body:
-            query += f" and body: {body[:100]}..." if len(body) > 100 else f" and body: {body}"
-        if cc:
-            query += f", CC: {cc}"
-        if bcc:
-            query += f", BCC: {bcc}"
-        return query
-    
-    elif tool_id == 'gmail_read':
-        hours = params.get('hours', 24)
-        unread_only = params.get('unread_only', True)
-        max_results = params.get('maxResults', 10)
-        return f"Read {'unread' if unread_only else 'recent'} emails from the last {hours} hours, maximum {max_results} results"
-    
-    elif tool_id == 'gmail_search':
-        query_param = params.get('query', '')
-        return f"Search emails with query: {query_param}"
-    
-    elif tool_id == 'gmail_reply':
-        original_from = params.get('original_from_email', '')
-        original_subject = params.get('original_subject', '')
-        reply_body = params.get('reply_body', '')
-        return f"Reply to email from {original_from} with subject '{original_subject}' and reply: {reply_body[:100]}..."
-    
-    # Google Drive
-    elif tool_id == 'google_drive_upload':
-        file_name = params.get('fileName') or params.get('name', 'file')
-        folder_id = params.get('folderId', '')
-        if folder_id:
-            return f"Upload file {file_name} to Google Drive folder {folder_id}"
-        return f"Upload file {file_name} to Google Drive"
-    
-    elif tool_id == 'google_drive_list':
-        folder_id = params.get('folderId', '')
-        query = params.get('query', '')
-        if query:
-            return f"List files in Google Drive matching: {query}"
-        if folder_id:
-            return f"List files in Google Drive folder {folder_id}"
-        return "List files in Google Drive"
-    
-    elif tool_id == 'google_drive_download':
-        file_id = params.get('fileId', '')
-        return f"Download file from Google Drive with ID: {file_id}"
-    
-    elif tool_id == 'google_drive_share':
-        file_id = params.get('fileId', '')
-        email = params.get('email', '')
-        return f"Share Google Drive file {file_id} with {email}"
-    
-    elif tool_id == 'google_drive_create_folder':
-        folder_name = params.get('name', 'New Folder')
-        parent_id = params.get('parentId', '')
-        if parent_id:
-            return f"Create folder '{folder_name}' in Google Drive folder {parent_id}"
-        return f"Create folder '{folder_name}' in Google Drive"
-    
-    # Google Sheets
-    elif tool_id == 'google_sheets_read':
-        spreadsheet_id = params.get('spreadsheetId', '')
-        range_name = params.get('range', '')
-        return f"Read data from Google Sheets {spreadsheet_id} range {range_name}"
-    
-    elif tool_id == 'google_sheets_write':
-        spreadsheet_id = params.get('spreadsheetId', '')
-        range_name = params.get('range', '')
-        return f"Write data to Google Sheets {spreadsheet_id} range {range_name}"
-    
-    # Google Docs
-    elif tool_id == 'google_docs_read':
-        document_id = params.get('documentId', '')
-        return f"Read Google Docs document {document_id}"
-    
-    elif tool_id == 'google_docs_create':
-        title = params.get('title', 'New Document')
-        return f"Create Google Docs document with title: {title}"
+    builder = _QUERY_BUILDERS.get(tool_id)
+    if builder:
+        return builder(params)
     
     # Default: use params as JSON string
-    return f"Execute {tool_id} with parameters: {json.dumps(params, default=str)}"
+    return f"Execute {tool_id} with parameters: {serialize_params(params).decode()}"
 
 # ============================================================================
 # Result Parsing
@@ -373,30 +735,91 @@ def parse_crewai_result(result: Any) -> Dict[str, Any]:
             'message': str(result)
         }
 
+
+def make_json_safe(value: Any) -> Any:
+    """
+    Convert a parsed result into plain JSON types before it is cached or returned
+    
+    Responses are serialized by orjson without FastAPI's encoder, so nested
+    Pydantic models, sets, Decimals etc. from the flow must be converted here.
+    Objects jsonable_encoder can't walk are stringified.
+    """
+    try:
+        return jsonable_encoder(value)
+    except (TypeError, ValueError):
+        return json.loads(json.dumps(value, default=str))
+
+# ============================================================================
+# Result Cache
+# ============================================================================
+
+# Reads may be up to RESULT_CACHE_TTL seconds stale. Successful writes through
+# this server invalidate their crew's entries; outside changes are not seen
+RESULT_CACHE_TTL = int(os.getenv("CREWAI_CACHE_TTL", "30"))
+
+# Only idempotent reads are cached; anything that sends/creates/updates/etc.
+# must reach the flow every time
+_CACHEABLE_TOOLS = frozenset(
+    tool_id for tool_id in TOOL_TO_CREW_MAPPING
+    if tool_id.endswith(('_read', '_list', '_get', '_search'))
+)
+
+# Values are (crew_name, parsed_result) so writes can drop their crew's reads
+_result_cache: TTLCache = TTLCache(maxsize=1024, ttl=RESULT_CACHE_TTL)
+_result_cache_lock = asyncio.Lock()
+# Bumped by every write; a read that overlapped one must not store its result
+_crew_generation: Dict[str, int] = {}
+
+
+async def invalidate_cached_results(crew_name: str) -> None:
+    """Drop cached reads for a crew after one of its state-changing tools succeeds"""
+    async with _result_cache_lock:
+        _crew_generation[crew_name] = _crew_generation.get(crew_name, 0) + 1
+        _result_cache.expire()
+        stale = [key for key, (cached_crew, _) in _result_cache.items() if cached_crew == crew_name]
+        for key in stale:
+            _result_cache.pop(key, None)
+
+
+def serialize_params(params: Dict[str, Any]) -> bytes:
+    """Canonical params bytes (sorted keys), shared by the cache key and the log line"""
+    try:
+        return orjson.dumps(params, default=str, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+    except TypeError:
+        # Valid JSON orjson rejects (integers beyond 64 bits, lone surrogates);
+        # the stdlib encoder escapes/accepts both
+        return json.dumps(params, sort_keys=True, default=str).encode()
+
+
+def result_cache_key(tool_id: str, params_json: bytes, user_query: str) -> bytes:
+    """Stable 16-byte hash of a tool request; bytes keys hash faster than hex strings"""
+    digest = hashlib.blake2b(digest_size=16)
+    # NUL separators can't occur inside tool ids or serialized JSON
+    digest.update(tool_id.encode())
+    digest.update(b"\0")
+    digest.update(params_json)
+    digest.update(b"\0")
+    digest.update(user_query.encode(errors="surrogatepass"))
+    return digest.digest()
+
 # ============================================================================
 # API Endpoints
 # ============================================================================
 
-@app.get("/health", response_model=HealthResponse)
+@app.get("/health", responses={200: {"model": HealthResponse}})
 async def health_check():
     """Health check endpoint"""
-    return {
-        "status": "healthy",
-        "service": "CrewAI Tool Wrapper API",
-        "timestamp": datetime.utcnow().isoformat(),
-        "version": "1.0.0"
-    }
+    return ORJSONResponse(content={
+        **_HEALTH_RESPONSE_BASE,
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="milliseconds")
+    })
 
-@app.get("/api/tools/google-suite/list", response_model=ToolListResponse)
+@app.get("/api/tools/google-suite/list", responses={200: {"model": ToolListResponse}})
 async def list_available_tools():
     """List all available Google Suite tools"""
-    return {
-        "tools": list(TOOL_TO_CREW_MAPPING.keys()),
-        "mappings": TOOL_TO_CREW_MAPPING,
-        "total": len(TOOL_TO_CREW_MAPPING)
-    }
+    return Response(content=_LIST_RESPONSE_BODY, media_type="application/json")
 
-@app.post("/api/tools/google-suite/execute", response_model=ToolExecuteResponse)
+@app.post("/api/tools/google-suite/execute", responses={200: {"model": ToolExecuteResponse}})
 async def execute_google_suite_tool(request: ToolExecuteRequest):
     """
     Execute Google Suite tool via CrewAI flow
@@ -411,27 +834,32 @@ async def execute_google_suite_tool(request: ToolExecuteRequest):
     4. Executes with CrewAI agent + tools
     5. Returns formatted response
     """
-    start_time = datetime.utcnow()
+    start_time = time.perf_counter()
     
     try:
         tool_id = request.toolId
         params = request.params
         
-        print(f"\n{'='*60}")
-        print(f"[TOOL] Tool Execution Request")
-        print(f"{'='*60}")
-        print(f"Tool ID: {tool_id}")
-        print(f"Params: {json.dumps(params, indent=2, default=str)}")
+        cacheable = RESULT_CACHE_TTL > 0 and tool_id in _CACHEABLE_TOOLS
+        
+        # Serialize params once; the same bytes feed the log line and the cache key
+        params_json = None
+        if cacheable or log.isEnabledFor(logging.INFO):
+            params_json = serialize_params(params)
+        
+        log.info("[TOOL] Tool Execution Request: %s", tool_id)
+        if params_json is not None:
+            log.info("Params: %s", params_json.decode())
         
         # Validate tool ID
-        if tool_id not in TOOL_TO_CREW_MAPPING:
-            error_msg = f"Unknown tool ID: {tool_id}. Available tools: {list(TOOL_TO_CREW_MAPPING.keys())}"
-            print(f"[ERROR] {error_msg}")
-            return ToolExecuteResponse(
+        if tool_id not in _TOOL_SET:
+            error_msg = f"Unknown tool ID: {tool_id}. Available tools: {list(_TOOLS_LIST)}"
+            log.error("[ERROR] %s", error_msg)
+            return tool_execute_response(
                 success=False,
                 output=None,
                 error=error_msg,
-                metadata={"available_tools": list(TOOL_TO_CREW_MAPPING.keys())}
+                metadata={"available_tools": _TOOLS_LIST}
             )
         
         # Get user query (either provided or generated from params)
@@ -439,96 +867,221 @@ async def execute_google_suite_tool(request: ToolExecuteRequest):
         if not user_query:
             user_query = convert_params_to_user_query(tool_id, params)
         
-        print(f"User Query: {user_query}")
+        log.info("User Query: %s", user_query)
         
         # Get crew name from tool mapping
         crew_name = TOOL_TO_CREW_MAPPING.get(tool_id, 'GOOGLE_SUITE_FLOW')
-        print(f"Crew Name: {crew_name}")
+        log.info("Crew Name: %s", crew_name)
         
-        # Get CrewAI Flow (following umbrella_corp pattern)
-        # Lazy initialization - flow is created on first request to avoid slow startup
-        print(f"[START] Getting GoogleSuiteFlow (lazy initialization)...")
-        flow = get_google_suite_flow()
+        # Repeat reads within the TTL are answered from the result cache
+        cache_key = None
+        parsed_result = None
+        if cacheable:
+            cache_key = result_cache_key(tool_id, params_json, user_query)
+            async with _result_cache_lock:
+                entry = _result_cache.get(cache_key)
+            if entry is not None:
+                parsed_result = entry[1]
+            else:
+                generation = _crew_generation.get(crew_name, 0)
+        cached = parsed_result is not None
         
-        # Execute flow (following umbrella_corp pattern from googlesuite_flow.py and router_flow.py)
-        # Pattern matches: flow.kickoff(inputs={"user_query": ..., "crew_name": ..., "flow_name": ...})
-        # As seen in router_flow.py line 102 and googlesuite_flow.py lines 88, 95
-        # Note: kickoff() is synchronous, so we run it in a thread pool to avoid asyncio event loop conflicts
-        print(f"[START] Executing CrewAI Flow...")
-        
-        # Run synchronous kickoff in thread pool to avoid asyncio conflicts
-        loop = asyncio.get_event_loop()
-        executor = ThreadPoolExecutor(max_workers=1)
-        result = await loop.run_in_executor(
-            executor,
-            lambda: flow.kickoff(inputs={
+        if cached:
+            log.info("[OK] Result cache hit")
+        else:
+            # Get CrewAI Flow (following umbrella_corp pattern)
+            # Normally warmed in lifespan; initialized here when CREWAI_LAZY_INIT=1
+            # or the warm-up failed
+            log.info("[START] Getting GoogleSuiteFlow...")
+            flow = await get_google_suite_flow()
+            
+            # Execute flow (following umbrella_corp pattern from googlesuite_flow.py and router_flow.py)
+            # Pattern matches: flow.kickoff(inputs={"user_query": ..., "crew_name": ..., "flow_name": ...})
+            # As seen in router_flow.py line 102 and googlesuite_flow.py lines 88, 95
+            # Note: kickoff() is synchronous, so we run it in a thread pool to avoid asyncio event loop conflicts
+            log.info("[START] Executing CrewAI Flow...")
+            inputs = {
                 "user_query": user_query,
                 "crew_name": crew_name,
                 "flow_name": crew_name,  # Following router_flow.py pattern where flow_name = crew_name
-            })
-        )
-        
-        # Parse result
-        parsed_result = parse_crewai_result(result)
+            }
+            
+            # Run synchronous kickoff in thread pool to avoid asyncio conflicts;
+            # concurrent requests are coalesced into batches by KICKOFF_BATCHER
+            result = await KICKOFF_BATCHER.submit(flow, inputs)
+            
+            # Parse result
+            parsed_result = make_json_safe(parse_crewai_result(result))
+            
+            if cache_key is not None:
+                async with _result_cache_lock:
+                    # Skip the store if a write for this crew finished meanwhile
+                    if _crew_generation.get(crew_name, 0) == generation:
+                        _result_cache[cache_key] = (crew_name, parsed_result)
+            elif RESULT_CACHE_TTL > 0:
+                # A write may have changed what this crew's reads return
+                await invalidate_cached_results(crew_name)
         
-        execution_time = (datetime.utcnow() - start_time).total_seconds()
+        execution_time = time.perf_counter() - start_time
         
-        print(f"[OK] Execution completed in {execution_time:.2f}s")
-        print(f"Response: {parsed_result.get('message', 'N/A')[:200]}...")
-        print(f"{'='*60}\n")
+        log.info("[OK] Execution completed in %.2fs", execution_time)
+        log.info("Response: %.200s...", parsed_result.get('message', 'N/A'))
         
-        return ToolExecuteResponse(
+        return tool_execute_response(
             success=True,
             output=parsed_result,
             metadata={
                 "tool_id": tool_id,
                 "crew_name": crew_name,
                 "execution_time_seconds": execution_time,
-                "timestamp": datetime.utcnow().isoformat()
+                "cached": cached,
+                "timestamp": datetime.now(timezone.utc).isoformat(timespec="milliseconds")
             }
         )
         
     except ValueError as e:
         error_msg = f"Configuration error: {str(e)}"
-        print(f"[ERROR] {error_msg}")
-        traceback.print_exc()
-        return ToolExecuteResponse(
+        log.exception("[ERROR] %s", error_msg)
+        return tool_execute_response(
             success=False,
             output=None,
             error=error_msg
         )
     except Exception as e:
         error_msg = f"Error executing tool {request.toolId}: {str(e)}"
-        print(f"[ERROR] {error_msg}")
-        traceback.print_exc()
-        return ToolExecuteResponse(
+        log.exception("[ERROR] %s", error_msg)
+        return tool_execute_response(
             success=False,
             output=None,
             error=error_msg,
-            metadata={"traceback": traceback.format_exc()}
+            metadata={"traceback": traceback.format_exc()} if IS_DEVELOPMENT else None
         )
 
+# ============================================================================
+# Streaming Endpoint
+# ============================================================================
+
+STREAM_CHUNK_SIZE = int(os.getenv("CREWAI_STREAM_CHUNK_SIZE", "1024"))
+STREAM_HEARTBEAT_SECONDS = float(os.getenv("CREWAI_STREAM_HEARTBEAT_SECONDS", "15"))
+
+
+def sse_event(payload: Dict[str, Any]) -> bytes:
+    """Encode one Server-Sent Event (orjson bytes, no intermediate str)"""
+    return b"data: " + orjson.dumps(payload, default=str) + b"\n\n"
+
+
+@app.post(STREAM_PATH)
+async def stream_google_suite_tool(request: ToolExecuteRequest):
+    """
+    Execute Google Suite tool via CrewAI flow, streaming the result as SSE
+    
+    Same request body as /execute. Events (each a JSON "data:" line):
+    - {"type": "start", ...}     sent immediately (fast time-to-first-byte)
+    - {"type": "heartbeat"}      while the flow is still running
+    - {"type": "chunk", "data"}  the result message, CREWAI_STREAM_CHUNK_SIZE chars at a time
+    - {"type": "done", ...}      output without the message text, plus metadata
+    - {"type": "error", ...}     if the flow fails
+    
+    kickoff() only returns once the flow has finished, so chunks start after
+    completion; the response is never held as one serialized body.
+    """
+    tool_id = request.toolId
+    params = request.params
+    
+    if tool_id not in _TOOL_SET:
+        error_msg = f"Unknown tool ID: {tool_id}. Available tools: {list(_TOOLS_LIST)}"
+        log.error("[ERROR] %s", error_msg)
+        return tool_execute_response(
+            success=False,
+            output=None,
+            error=error_msg,
+            metadata={"available_tools": _TOOLS_LIST}
+        )
+    
+    user_query = request.userQuery or convert_params_to_user_query(tool_id, params)
+    crew_name = TOOL_TO_CREW_MAPPING.get(tool_id, 'GOOGLE_SUITE_FLOW')
+    log.info("[TOOL] Streaming %s via %s: %s", tool_id, crew_name, user_query)
+    
+    async def events():
+        start_time = time.perf_counter()
+        yield sse_event({"type": "start", "tool_id": tool_id, "crew_name": crew_name, "user_query": user_query})
+        
+        kickoff = None
+        try:
+            flow = await get_google_suite_flow()
+            kickoff = asyncio.ensure_future(KICKOFF_BATCHER.submit(flow, {
+                "user_query": user_query,
+                "crew_name": crew_name,
+                "flow_name": crew_name,
+            }))
+            while True:
+                done, _ = await asyncio.wait({kickoff}, timeout=STREAM_HEARTBEAT_SECONDS)
+                if done:
+                    break
+                yield sse_event({"type": "heartbeat"})
+            parsed_result = make_json_safe(parse_crewai_result(kickoff.result()))
+            if RESULT_CACHE_TTL > 0 and tool_id not in _CACHEABLE_TOOLS:
+                await invalidate_cached_results(crew_name)
+        except Exception as e:
+            error_msg = f"Error executing tool {tool_id}: {str(e)}"
+            log.exception("[ERROR] %s", error_msg)
+            yield sse_event({"type": "error", "error": error_msg})
+            return
+        finally:
+            # Client disconnected mid-run: stop waiting on the batch result
+            if kickoff is not None and not kickoff.done():
+                kickoff.cancel()
+        
+        message = parsed_result.get('message')
+        if isinstance(message, str):
+            for i in range(0, len(message), STREAM_CHUNK_SIZE):
+                yield sse_event({"type": "chunk", "data": message[i:i + STREAM_CHUNK_SIZE]})
+            # The message text was already streamed; parse_crewai_result usually
+            # puts the same string in 'data' too, so drop both copies
+            parsed_result = {k: v for k, v in parsed_result.items() if v is not message}
+        
+        yield sse_event({
+            "type": "done",
+            "output": parsed_result,
+            "metadata": {
+                "tool_id": tool_id,
+                "crew_name": crew_name,
+                "execution_time_seconds": time.perf_counter() - start_time,
+                "timestamp": datetime.now(timezone.utc).isoformat(timespec="milliseconds")
+            }
+        })
+    
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
 # ============================================================================
 # Error Handlers
 # ============================================================================
 
+# Prebuilt production 500 body: no per-request formatting or serialization
+_PROD_500 = orjson.dumps({"success": False, "error": "internal server error"})
+
 @app.exception_handler(HTTPException)
 async def http_exception_handler(request, exc):
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={"success": False, "error": exc.detail}
     )
 
 @app.exception_handler(Exception)
 async def general_exception_handler(request, exc):
-    print(f"[ERROR] Unhandled exception: {exc}")
-    traceback.print_exc()
-    return JSONResponse(
+    log.error("[ERROR] Unhandled exception: %s", exc, exc_info=exc)
+    if not IS_DEVELOPMENT:
+        return Response(content=_PROD_500, media_type="application/json", status_code=500)
+    return ORJSONResponse(
         status_code=500,
         content={
             "success": False,
             "error": f"Internal server error: {str(exc)}",
-            "traceback": traceback.format_exc()
+            "traceback": "".join(traceback.format_exception(exc))
         }
     )
 
@@ -538,20 +1091,33 @@ async def general_exception_handler(request, exc):
 
 if __name__ == "__main__":
     import uvicorn
+    from importlib.util import find_spec
     
     port = int(os.getenv("CREWAI_API_PORT", "8002"))
     host = os.getenv("CREWAI_API_HOST", "0.0.0.0")
+    workers = int(os.getenv("CREWAI_WORKERS", "1"))
+    # Reload only works with a single worker process
+    reload = workers == 1 and IS_DEVELOPMENT
+    
+    # uvloop (libuv event loop) and httptools (C HTTP parser) when installed;
+    # uvloop is not available on Windows, so fall back to uvicorn's defaults
+    loop = "uvloop" if find_spec("uvloop") else "auto"
+    http = "httptools" if find_spec("httptools") else "auto"
     
     print(f"\n[START] Starting server on localhost:{port}")
+    print(f"[INFO] Event loop: {loop}, HTTP parser: {http}, Workers: {workers}")
     print(f"[INFO] API Documentation: http://localhost:{port}/docs")
     print(f"[INFO] Health Check: http://localhost:{port}/health")
     print(f"[INFO] List Tools: http://localhost:{port}/api/tools/google-suite/list\n")
     
+    # uvicorn needs an import string (not the app object) for reload/workers
     uvicorn.run(
-        app,
+        "api_server:app" if reload or workers > 1 else app,
         host=host,
         port=port,
         log_level="info",
-        reload=os.getenv("ENVIRONMENT", "development") == "development"
+        loop=loop,
+        http=http,
+        workers=workers,
+        reload=reload
     )
-
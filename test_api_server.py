@@ -113,6 +113,79 @@ def test_execute_calendar_list():
                 print(f"   Response: {e.response.text[:200]}")
         return False
 
+def test_result_serialization():
+    """Test that a Pydantic-model flow result serializes (runs locally, no server)"""
+    print("\n[TEST] Result Serialization...")
+    try:
+        from decimal import Decimal
+        from pydantic import BaseModel
+        from api_server import make_json_safe, parse_crewai_result, tool_execute_response
+
+        class Attendee(BaseModel):
+            email: str
+
+        class EventResult(BaseModel):
+            summary: str
+            attendees: list[Attendee]
+            labels: set[str]
+            cost: Decimal
+
+        result = EventResult(
+            summary="Standup",
+            attendees=[Attendee(email="a@example.com")],
+            labels={"work"},
+            cost=Decimal("1.50")
+        )
+        output = make_json_safe(parse_crewai_result(result))
+        body = json.loads(tool_execute_response(success=True, output=output).body)
+        data = body['output']['data']
+        assert data['attendees'] == [{"email": "a@example.com"}], data
+        assert data['labels'] == ["work"], data
+        print(f"[OK] Result serialization passed")
+        return True
+    except Exception as e:
+        print(f"[ERROR] Result serialization failed: {e}")
+        return False
+
+def test_stream_gmail_read():
+    """Test Gmail read tool execution over the SSE stream endpoint"""
+    print("\n[TEST] Stream Gmail Read Tool...")
+    try:
+        payload = {
+            "toolId": "gmail_read",
+            "params": {
+                "hours": 24,
+                "unread_only": True,
+                "maxResults": 5
+            }
+        }
+        response = requests.post(
+            f"{API_URL}/api/tools/google-suite/stream",
+            json=payload,
+            stream=True,
+            timeout=30
+        )
+        response.raise_for_status()
+        events = []
+        for line in response.iter_lines(decode_unicode=True):
+            if line and line.startswith("data: "):
+                events.append(json.loads(line[len("data: "):]))
+        types = [event.get('type') for event in events]
+        if types[-1:] == ['error']:
+            print(f"[ERROR] Stream tool failed: {events[-1].get('error')}")
+            return False
+        if types[:1] != ['start'] or types[-1:] != ['done']:
+            print(f"[ERROR] Stream tool failed: unexpected events {types}")
+            return False
+        print(f"[OK] Stream tool passed")
+        print(f"   Events: {len(events)} ({', '.join(sorted(set(types)))})")
+        message = ''.join(event.get('data', '') for event in events if event.get('type') == 'chunk')
+        print(f"   Response: {message[:200]}...")
+        return True
+    except Exception as e:
+        print(f"[ERROR] Stream tool failed: {e}")
+        return False
+
 def wait_for_server(max_wait=30):
     """Wait for server to be ready"""
     print(f"\n[INFO] Waiting for server at {API_URL}...")
@@ -144,10 +217,12 @@ def main():
     
     # Run tests
     results = []
+    results.append(("Result Serialization", test_result_serialization()))
     results.append(("Health Check", test_health()))
     results.append(("List Tools", test_list_tools()))
     results.append(("Gmail Read", test_execute_gmail_read()))
     results.append(("Calendar List", test_execute_calendar_list()))
+    results.append(("Gmail Read (stream)", test_stream_gmail_read()))
     
     # Summary
     print("\n" + "="*60)